@@ -9,6 +9,9 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import os
 import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import numpy as np
 import struct
@@ -16,6 +19,8 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.colors import to_rgba
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection, Line3DCollection
 import math
 import struct
 
@@ -26,7 +31,189 @@ except ImportError:
     TRIMESH_AVAILABLE = False
     print("ERROR: Missing trimesh library! Install: pip install trimesh")
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# On-disk layout of one binary STL triangle (50 bytes)
+STL_TRIANGLE_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attributes', '<u2')
+])
+
+# Corner pairs forming the 12 edges of a box (corners ordered bottom face, then top face)
+BOX_EDGES = np.array([
+    [0, 1], [1, 2], [2, 3], [3, 0],  # bottom
+    [4, 5], [5, 6], [6, 7], [7, 4],  # top
+    [0, 4], [1, 5], [2, 6], [3, 7]   # vertical
+])
+
+# Inward normals of a box's six faces, in (x_min, x_max, y_min, y_max, z_min, z_max) order
+BOX_PLANE_NORMALS = np.array([
+    [1, 0, 0], [-1, 0, 0],
+    [0, 1, 0], [0, -1, 0],
+    [0, 0, 1], [0, 0, -1]
+], dtype=float)
+
+def box_edge_segments(bounds):
+    """Edge segments (N*12, 2, 3) for boxes given as (x_min, x_max, y_min, y_max, z_min, z_max) rows"""
+    # Drawing only - float32 is exact at screen resolution and halves projection bandwidth
+    bounds = np.asarray(bounds, dtype=np.float32).reshape(-1, 6)
+    
+    corners = np.stack([bounds[:, [0, 1, 1, 0, 0, 1, 1, 0]],
+                        bounds[:, [2, 2, 3, 3, 2, 2, 3, 3]],
+                        bounds[:, [4, 4, 4, 4, 5, 5, 5, 5]]], axis=-1)
+    
+    return corners[:, BOX_EDGES].reshape(-1, 2, 3)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def faces_in_bounds(vertices, faces, x_min, x_max, y_min, y_max, z_min, z_max):
+        """Mask of faces with at least one vertex inside the bounds, in a single fused pass"""
+        mask = np.zeros(faces.shape[0], dtype=np.bool_)
+        for i in prange(faces.shape[0]):
+            for k in range(3):
+                x, y, z = vertices[faces[i, k], 0], vertices[faces[i, k], 1], vertices[faces[i, k], 2]
+                if x_min <= x <= x_max and y_min <= y <= y_max and z_min <= z <= z_max:
+                    mask[i] = True
+                    break
+        return mask
+else:
+    def faces_in_bounds(vertices, faces, x_min, x_max, y_min, y_max, z_min, z_max):
+        """Mask of faces with at least one vertex inside the bounds"""
+        inside = ((vertices[:, 0] >= x_min) & (vertices[:, 0] <= x_max) &
+                  (vertices[:, 1] >= y_min) & (vertices[:, 1] <= y_max) &
+                  (vertices[:, 2] >= z_min) & (vertices[:, 2] <= z_max))
+        return inside[faces].any(axis=1)
+
+def face_aabbs(vertices, faces):
+    """Per-face bounding boxes as six float32 arrays (min x/y/z, max x/y/z)"""
+    triangles = vertices[faces]
+    
+    # Round outward so the float32 boxes never shrink below the true triangle
+    face_min = np.nextafter(triangles.min(axis=1).astype(np.float32), np.float32(-np.inf))
+    face_max = np.nextafter(triangles.max(axis=1).astype(np.float32), np.float32(np.inf))
+    return tuple(np.ascontiguousarray(axis) for axis in (*face_min.T, *face_max.T))
+
+def faces_overlapping(face_bounds, x_min, x_max, y_min, y_max, z_min, z_max):
+    """Mask of faces whose bounding box overlaps the given box"""
+    fmin_x, fmin_y, fmin_z, fmax_x, fmax_y, fmax_z = face_bounds
+    return ((fmax_x >= x_min) & (fmin_x <= x_max) &
+            (fmax_y >= y_min) & (fmin_y <= y_max) &
+            (fmax_z >= z_min) & (fmin_z <= z_max))
+
+# Mesh being split, rebuilt once in each worker process
+_worker_mesh = None
+_worker_vertices = None
+_worker_faces = None
+_worker_face_bounds = None
+
+def _init_split_worker(vertices, faces, face_bounds):
+    """Process pool initializer - receive the mesh arrays once per worker"""
+    global _worker_mesh, _worker_vertices, _worker_faces, _worker_face_bounds
+    _worker_mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    
+    # Plain arrays for the fallback - skips TrackedArray bookkeeping on every access
+    _worker_vertices = vertices
+    _worker_faces = faces
+    _worker_face_bounds = face_bounds
+
+def _process_part(bounds, part_num, output_filepath):
+    """Cut one part out of the worker mesh and export it"""
+    x_min, x_max, y_min, y_max, z_min, z_max = bounds
+    result = {'part_number': part_num, 'filename': output_filepath,
+              'method': None, 'triangles': 0, 'vertices': 0, 'error': None}
+    
+    try:
+        # Clip against the six box planes first - no boolean engine needed
+        try:
+            # Each plane passes through its bound on its own axis
+            plane_origins = np.abs(BOX_PLANE_NORMALS) * np.asarray(bounds, dtype=float)[:, None]
+            
+            section = _worker_mesh
+            for plane_origin, plane_normal in zip(plane_origins, BOX_PLANE_NORMALS):
+                # Intermediate sections are exported as-is - skip trimesh's merge/cleanup pass
+                section = trimesh.intersections.slice_mesh_plane(section, plane_normal=plane_normal,
+                                                                 plane_origin=plane_origin, cap=True,
+                                                                 process=False)
+                if len(section.faces) == 0:
+                    break
+            
+            # Check if the section contains geometry
+            if len(section.faces) == 0:
+                return result
+            
+            # Use trimesh export
+            section.export(output_filepath)
+            result.update(method='clip', triangles=len(section.faces), vertices=len(section.vertices))
+            
+        except Exception as clip_error:
+            # Fallback to vertex filtering method for non-watertight models
+            print(f"Part {part_num}: Plane clipping failed ({clip_error}), trying fallback method...")
+            
+            # Get original mesh data
+            original_vertices = _worker_vertices
+            original_faces = _worker_faces
+            
+            # Narrow down to faces whose bounding box touches the part
+            candidates = np.nonzero(faces_overlapping(_worker_face_bounds, *bounds))[0]
+            
+            # Find faces that have at least one vertex in the bounds
+            valid_faces = candidates[faces_in_bounds(
+                original_vertices, np.ascontiguousarray(original_faces[candidates]),
+                x_min, x_max, y_min, y_max, z_min, z_max)]
+            
+            if len(valid_faces) == 0:
+                return result
+            
+            # Extract valid faces and their vertices
+            part_faces = original_faces[valid_faces]
+            
+            # Get all unique vertices used by these faces, plus the reindexed faces
+            unique_vertex_indices, inverse = np.unique(part_faces, return_inverse=True)
+            part_vertices = original_vertices[unique_vertex_indices]
+            reindexed_faces = inverse.reshape(part_faces.shape).astype(np.uint32)
+            
+            # Export the part using simple STL writer
+            write_stl_simple(output_filepath, part_vertices, reindexed_faces)
+            result.update(method='fallback', triangles=len(reindexed_faces), vertices=len(part_vertices))
+        
+    except Exception as part_error:
+        result['error'] = str(part_error)
+    
+    return result
+
+def write_stl_simple(filename, vertices, faces):
+    """Simple STL writer as fallback"""
+    triangles = vertices[faces]
+    
+    # Calculate normal vectors for all triangles at once
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    norms = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.where(norms > 0, normals / np.where(norms > 0, norms, 1), [0.0, 0.0, 1.0])
+    
+    # Lay out the whole file in one buffer - header, triangle count, then the records
+    buffer = np.zeros(84 + len(faces) * STL_TRIANGLE_DTYPE.itemsize, dtype=np.uint8)
+    header = f'STL Part - {len(faces)} triangles'.encode('ascii')[:80]
+    buffer[:80] = np.frombuffer(header.ljust(80, b'\0'), dtype=np.uint8)
+    buffer[80:84].view('<u4')[0] = len(faces)
+    
+    # Fill the triangle records in place (attribute bytes stay zero)
+    records = buffer[84:].view(STL_TRIANGLE_DTYPE)
+    records['normal'] = normals
+    records['vertices'] = triangles
+    
+    # One write - large enough buffers bypass Python's write buffer entirely
+    with open(filename, 'wb') as f:
+        f.write(buffer)
+
 class STL3DTrimeshSplitterGUI:
+    # Upper bound on triangles drawn by the matplotlib preview
+    PREVIEW_MAX_FACES = 2000
+    
     def __init__(self, root):
         self.root = root
         self.root.title("STL 3D Model Splitter v2.0 (Trimesh)")
@@ -48,9 +235,23 @@ class STL3DTrimeshSplitterGUI:
         
         # Model data
         self.mesh = None
+        self._verts = None
+        self._faces = None
+        self._face_bounds = None
+        self._sampled_tris = None
+        self._sampled_centroids = None
+        self._poly = None
+        self._split_boxes = None
+        self._split_labels = []
+        self._overlay_source = None
+        self._background = None
+        self._split_overlay_active = False
         self.model_bounds = None
         self.split_preview = []
+        self._split_bounds = None
         self.update_timer = None
+        self.flip_timer = None
+        self._mesh_flipped = False
         
         # Bind file variable to auto-load
         self.input_file.trace_add('write', self.on_file_selected)
@@ -214,6 +415,7 @@ class STL3DTrimeshSplitterGUI:
         self.ax.set_title("Load STL to view 3D preview")
         
         self.canvas = FigureCanvasTkAgg(self.fig, view_frame)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         self.canvas.draw()
         
         canvas_widget = self.canvas.get_tk_widget()
@@ -269,7 +471,36 @@ class STL3DTrimeshSplitterGUI:
     def on_flip_changed(self):
         """Handle model orientation change"""
         if self.mesh is not None:
-            self.load_and_analyze_model()
+            # Debounce rapid toggles - the loaded mesh is rotated in place, not re-read
+            if self.flip_timer:
+                self.root.after_cancel(self.flip_timer)
+            self.flip_timer = self.root.after(300, self._apply_flip)
+    
+    def _apply_flip(self):
+        """Rotate the loaded model 180° around X to match the flip checkbox"""
+        self.flip_timer = None
+        if self.mesh is None or self.flip_model.get() == self._mesh_flipped:
+            return
+        
+        print("Applying 180° rotation around X-axis")
+        rotation_matrix = trimesh.transformations.rotation_matrix(np.pi, [1, 0, 0])
+        self.mesh.apply_transform(rotation_matrix)
+        self._mesh_flipped = not self._mesh_flipped
+        
+        # Same rotation on the render copy: (x, y, z) -> (x, -y, -z)
+        self._verts[:, 1:] *= -1
+        self._cache_preview_geometry()
+        self._face_bounds = face_aabbs(np.asarray(self.mesh.vertices), np.asarray(self.mesh.faces))
+        
+        bounds = self.mesh.bounds
+        self.model_bounds = (bounds[0][0], bounds[1][0], 
+                           bounds[0][1], bounds[1][1],
+                           bounds[0][2], bounds[1][2])
+        
+        # Redraw whichever view is showing - the split overlay redraws itself on update
+        self.update_split_preview()
+        if not self._split_overlay_active:
+            self.refresh_3d_view()
     
     def schedule_preview_update(self):
         """Schedule preview update with debouncing"""
@@ -300,18 +531,31 @@ class STL3DTrimeshSplitterGUI:
             input_path = self.input_file.get()
             
             print(f"Loading file: {input_path}")
-            mesh = trimesh.load(input_path)
-            
+            mesh = self._load_binary_stl_fast(input_path)
+            if mesh is None:
+                # ASCII STL or other format - let trimesh handle it
+                mesh = trimesh.load(input_path)
+
             if not isinstance(mesh, trimesh.Trimesh):
                 raise ValueError("Failed to load STL file as valid 3D mesh")
             
             # Apply rotation if requested
-            if self.flip_model.get():
+            flipped = self.flip_model.get()
+            if flipped:
                 print("Applying 180° rotation around X-axis")
                 rotation_matrix = trimesh.transformations.rotation_matrix(np.pi, [1, 0, 0])
                 mesh.apply_transform(rotation_matrix)
             
             self.mesh = mesh
+            self._mesh_flipped = flipped
+            
+            # Plain float32/int32 copies for rendering - no TrackedArray hashing, half the bandwidth
+            self._verts = np.asarray(mesh.vertices, dtype=np.float32)
+            self._faces = np.asarray(mesh.faces, dtype=np.int32)
+            self._cache_preview_geometry()
+            
+            # Per-face bounding boxes, reused by every split
+            self._face_bounds = face_aabbs(np.asarray(mesh.vertices), np.asarray(mesh.faces))
             
             # Calculate model bounds
             bounds = mesh.bounds
@@ -323,23 +567,25 @@ class STL3DTrimeshSplitterGUI:
             depth = bounds[1][1] - bounds[0][1]
             height = bounds[1][2] - bounds[0][2]
             
-            # Update model information display (thread-safe)
             info_text = (f"📏 Dimensions: {width:.1f} × {depth:.1f} × {height:.1f} mm\n"
                         f"🔺 Triangles: {len(mesh.faces):,}\n"
-                        f"🔘 Vertices: {len(mesh.vertices):,}\n"
-                        f"📦 Volume: {mesh.volume:.1f} mm³\n"
-                        f"✅ Watertight: {'Yes' if mesh.is_watertight else 'No'}")
-            
-            self.root.after(0, lambda: self.model_info_label.configure(text=info_text, foreground="black"))
+                        f"🔘 Vertices: {len(mesh.vertices):,}")
             
             print(f"Model loaded: {width:.1f}×{depth:.1f}×{height:.1f} mm")
             print(f"Triangles: {len(mesh.faces)}, Vertices: {len(mesh.vertices)}")
-            print(f"Watertight: {mesh.is_watertight}")
             
-            # Update split preview and enable controls (thread-safe)
-            self.root.after(0, self.update_split_preview)
-            self.root.after(0, lambda: self.split_button.configure(state='normal'))
-            self.root.after(0, self.refresh_3d_view)
+            # Update model info, split preview and controls in one main-thread callback
+            self.root.after(0, self._finalize_load_ui, info_text)
+            
+            if NUMBA_AVAILABLE:
+                # Compile the split filter now instead of on the first fallback part
+                faces_in_bounds(np.asarray(mesh.vertices[:1]), np.zeros((1, 3), dtype=mesh.faces.dtype),
+                                0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            
+            # Volume and watertight checks traverse the whole mesh - run them after the preview
+            analysis_thread = threading.Thread(target=self._analyze_model_thread, args=(mesh, info_text))
+            analysis_thread.daemon = True
+            analysis_thread.start()
             
         except Exception as e:
             error_msg = f"Error loading model: {str(e)}"
@@ -349,133 +595,208 @@ class STL3DTrimeshSplitterGUI:
             # Update GUI in main thread
             self.root.after(0, self.progress.stop)
             self.root.after(0, lambda: self.status_label.configure(text="Model loaded", foreground="green"))
+    
+    def _finalize_load_ui(self, info_text):
+        """Apply all post-load GUI updates at once, ending with a single canvas redraw"""
+        self.model_info_label.configure(
+            text=info_text + "\n📦 Volume: calculating...\n✅ Watertight: calculating...",
+            foreground="black")
+        self.refresh_3d_view()
+        self.update_split_preview()
+        self.split_button.configure(state='normal')
+    
+    def _analyze_model_thread(self, mesh, info_text):
+        """Compute volume and watertightness in the background and append them to the model info"""
+        try:
+            volume = mesh.volume
+            watertight = mesh.is_watertight
+        except Exception as e:
+            print(f"Error analyzing model: {e}")
+            return
+        
+        print(f"Watertight: {watertight}")
+        
+        # Skip the update if another model was loaded in the meantime
+        if mesh is not self.mesh:
+            return
+        
+        info_text += (f"\n📦 Volume: {volume:.1f} mm³\n"
+                      f"✅ Watertight: {'Yes' if watertight else 'No'}")
+        
+        self.root.after(0, lambda: self.model_info_label.configure(text=info_text, foreground="black"))
 # CZĘŚĆ 2/2 - KONTYNUACJA KLASY STL3DTrimeshSplitterGUI
 
     def calculate_splits(self, model_size, max_size):
         """Calculate number of splits required for given dimension"""
         if max_size is None or max_size <= 0:
             return 1
-        splits = np.ceil(model_size / max_size)
-        return int(splits)
+        return max(1, math.ceil(model_size / max_size))
+    
+    def _cache_preview_geometry(self):
+        """Subsample faces once so redraws reuse the same preview triangles"""
+        # Fixed seed keeps the preview identical across redraws without stride bias
+        count = min(self.PREVIEW_MAX_FACES, len(self._faces))
+        sample = np.random.default_rng(0).choice(len(self._faces), size=count, replace=False)
+        sampled_faces = self._faces[np.sort(sample)]
+        
+        self._sampled_tris = self._verts[sampled_faces]
+        self._sampled_centroids = self._sampled_tris.mean(axis=1)
     
     def update_split_preview(self):
         if not self.model_bounds or not self.mesh:
             return
         
         try:
-            min_x, max_x, min_y, max_y, min_z, max_z = self.model_bounds
-            
-            width = max_x - min_x
-            depth = max_y - min_y
-            height = max_z - min_z
-            
-            max_x_size = self.max_x.get()
-            max_y_size = self.max_y.get()
-            max_z_size = self.max_z.get()
-            
-            # Calculate required splits - only X and Y (like the working code)
-            xsplit = self.calculate_splits(width, max_x_size)
-            ysplit = self.calculate_splits(depth, max_y_size)
-            # Z-axis is not split - keep full height
-            zsplit = 1
-            
-            total_parts = xsplit * ysplit * zsplit
-            
-            # Calculate actual segment dimensions
-            segment_size_x = width / xsplit
-            segment_size_y = depth / ysplit
-            segment_size_z = height  # Full height
-            
-            # Generate split configuration data
-            self.split_preview = []
-            x_extent = np.linspace(min_x, max_x, xsplit + 1)
-            y_extent = np.linspace(min_y, max_y, ysplit + 1)
-            # Z extent is just the full range
-            z_min, z_max = min_z, max_z
-            
-            part_number = 1
-            for i in range(xsplit):
-                for j in range(ysplit):
-                    x_min = x_extent[i]
-                    x_max = x_extent[i + 1] 
-                    y_min = y_extent[j]
-                    y_max = y_extent[j + 1]
-                    
-                    self.split_preview.append({
-                        'bounds': (x_min, x_max, y_min, y_max, z_min, z_max),
-                        'index': (i, j),
-                        'part_number': part_number
-                    })
-                    part_number += 1
-            
-            # Update UI with split information
-            if total_parts == 1:
-                split_text = "✅ Model fits in build volume - no splitting required"
-                color = "green"
-            else:
-                split_text = (f"📦 Split into {total_parts} parts ({xsplit}×{ysplit})\n"
-                             f"📏 Each part size: ~{segment_size_x:.1f}×{segment_size_y:.1f}×{segment_size_z:.1f} mm\n"
-                             f"🔧 Model dimensions: {width:.1f}×{depth:.1f}×{height:.1f} mm\n"
-                             f"🖨️ Max build volume: {max_x_size:.0f}×{max_y_size:.0f}×{max_z_size:.0f} mm")
-                color = "blue"
-            
+            split_text, color = self._recompute_split_config()
             self.split_info_label.configure(text=split_text, foreground=color)
             
         except Exception as e:
             self.split_info_label.configure(text=f"Error calculating split: {str(e)}", 
                                           foreground="red")
             print(f"Error in update_split_preview: {e}")
-    
-    def refresh_3d_view(self):
-        """Render 3D model visualization"""
-        if not self.mesh:
             return
         
-        self.ax.clear()
+        # Only redraw the 3D overlay while it is on screen
+        if self._split_overlay_active:
+            self._render_split_overlay()
+    
+    def _recompute_split_config(self):
+        """Recompute split bounds for the current build volume, returning label text and color"""
+        min_x, max_x, min_y, max_y, min_z, max_z = self.model_bounds
         
-        # Get mesh geometry for visualization
-        vertices = self.mesh.vertices
-        faces = self.mesh.faces
+        width = max_x - min_x
+        depth = max_y - min_y
+        height = max_z - min_z
+        
+        max_x_size = self.max_x.get()
+        max_y_size = self.max_y.get()
+        max_z_size = self.max_z.get()
+        
+        # Calculate required splits - only X and Y (like the working code)
+        xsplit = self.calculate_splits(width, max_x_size)
+        ysplit = self.calculate_splits(depth, max_y_size)
+        # Z-axis is not split - keep full height
+        zsplit = 1
+        
+        total_parts = xsplit * ysplit * zsplit
+        
+        # Calculate actual segment dimensions
+        segment_size_x = width / xsplit
+        segment_size_y = depth / ysplit
+        segment_size_z = height  # Full height
+        
+        # Generate split configuration data - one row per part, X-major order
+        x_extent = np.linspace(min_x, max_x, xsplit + 1)
+        y_extent = np.linspace(min_y, max_y, ysplit + 1)
+        x_lo, y_lo = np.meshgrid(x_extent[:-1], y_extent[:-1], indexing='ij')
+        x_hi, y_hi = np.meshgrid(x_extent[1:], y_extent[1:], indexing='ij')
+        
+        # Z extent is just the full range
+        self._split_bounds = np.column_stack([
+            x_lo.ravel(), x_hi.ravel(), y_lo.ravel(), y_hi.ravel(),
+            np.full(total_parts, min_z), np.full(total_parts, max_z)
+        ])
+        
+        self.split_preview = [
+            {'bounds': tuple(bounds), 'index': divmod(k, ysplit), 'part_number': k + 1}
+            for k, bounds in enumerate(self._split_bounds.tolist())
+        ]
         
-        # Subsample faces for performance
-        max_faces = 2000
-        if len(faces) > max_faces:
-            step = len(faces) // max_faces
-            sampled_faces = faces[::step]
+        # Split information for the UI label
+        if total_parts == 1:
+            split_text = "✅ Model fits in build volume - no splitting required"
+            color = "green"
         else:
-            sampled_faces = faces
+            split_text = (f"📦 Split into {total_parts} parts ({xsplit}×{ysplit})\n"
+                         f"📏 Each part size: ~{segment_size_x:.1f}×{segment_size_y:.1f}×{segment_size_z:.1f} mm\n"
+                         f"🔧 Model dimensions: {width:.1f}×{depth:.1f}×{height:.1f} mm\n"
+                         f"🖨️ Max build volume: {max_x_size:.0f}×{max_y_size:.0f}×{max_z_size:.0f} mm")
+            color = "blue"
         
-        # Create 3D surface collection
-        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+        return split_text, color
+    
+    def _clear_scene(self):
+        """Remove overlays from the 3D axes but keep the mesh collection for reuse"""
+        for artist in list(self.ax.lines) + list(self.ax.texts) + list(self.ax.collections):
+            if artist is not self._poly:
+                artist.remove()
+        
+        if self._poly is not None:
+            self._poly.set_visible(False)
+        
+        self.ax.title.set_animated(False)
+        self._split_boxes = None
+        self._split_labels = []
+        self._overlay_source = None
+        self._background = None
+    
+    def _on_canvas_draw(self, event):
+        """Cache the static scene after every full draw, then paint the split overlay on top"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_split_overlay()
+    
+    def _draw_split_overlay(self):
+        """Draw animated split boxes, labels and title onto the canvas"""
+        if self._split_boxes is None:
+            return
         
-        triangles = []
-        colors = []
+        self._split_boxes.do_3d_projection()
+        for artist in [self._split_boxes] + self._split_labels + [self.ax.title]:
+            self.ax.draw_artist(artist)
+    
+    def _blit_split_overlay(self):
+        """Redraw only the split overlay over the cached background"""
+        if self._background is None:
+            self.canvas.draw_idle()
+            return
         
-        for face in sampled_faces:
-            triangle = vertices[face]
-            triangles.append(triangle)
-            
-            # Height-based color gradient
-            avg_z = np.mean(triangle[:, 2])
-            if self.model_bounds:
-                min_z, max_z = self.model_bounds[4], self.model_bounds[5]
-                if max_z > min_z:
-                    z_norm = (avg_z - min_z) / (max_z - min_z)
-                    blue_intensity = 0.3 + 0.7 * (1 - z_norm)
-                    colors.append((0.1, 0.4, blue_intensity, 0.8))
-                else:
-                    colors.append((0.2, 0.5, 0.9, 0.8))
-            else:
-                colors.append((0.2, 0.5, 0.9, 0.8))
+        self.canvas.restore_region(self._background)
+        self._draw_split_overlay()
+        self.canvas.blit(self.fig.bbox)
+    
+    def _draw_mesh(self, triangles, colors, edgecolors, linewidths, alpha):
+        """Show preview triangles, updating the existing Poly3DCollection in place"""
+        if self._poly is None:
+            self._poly = Poly3DCollection(triangles,
+                                          facecolors=colors,
+                                          edgecolors=edgecolors,
+                                          linewidths=linewidths,
+                                          alpha=alpha)
+            self.ax.add_collection3d(self._poly)
+        else:
+            self._poly.set_verts(triangles)
+            self._poly.set_facecolor(colors)
+            self._poly.set_edgecolor(edgecolors)
+            self._poly.set_linewidth(linewidths)
+            self._poly.set_alpha(alpha)
         
+        self._poly.set_visible(True)
+    
+    def refresh_3d_view(self):
+        """Render 3D model visualization"""
+        if not self.mesh:
+            return
+        
+        self._split_overlay_active = False
+        self._clear_scene()
+        
+        # Subsampled triangles cached at load time - shape (N, 3, 3)
+        triangles = self._sampled_tris
+
+        # Height-based color gradient
+        colors = np.tile((0.2, 0.5, 0.9, 0.8), (len(triangles), 1))
+        if self.model_bounds:
+            min_z, max_z = self.model_bounds[4], self.model_bounds[5]
+            if max_z > min_z:
+                avg_z = self._sampled_centroids[:, 2]
+                z_norm = (avg_z - min_z) / (max_z - min_z)
+                colors[:, 0] = 0.1
+                colors[:, 1] = 0.4
+                colors[:, 2] = 0.3 + 0.7 * (1 - z_norm)
+
         # Render mesh surfaces
-        if triangles:
-            poly_collection = Poly3DCollection(triangles,
-                                             facecolors=colors,
-                                             edgecolors='navy',
-                                             linewidths=0.1,
-                                             alpha=0.8)
-            self.ax.add_collection3d(poly_collection)
+        if len(triangles):
+            self._draw_mesh(triangles, colors, edgecolors='navy', linewidths=0.1, alpha=0.8)
         
         # Configure 3D plot appearance
         self.ax.set_xlabel('X (mm)')
@@ -510,7 +831,7 @@ class STL3DTrimeshSplitterGUI:
         
         self.ax.view_init(elev=20, azim=45)
         self.ax.grid(True, alpha=0.3)
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def show_split_preview(self):
         """Visualize split boundaries on 3D model"""
@@ -518,97 +839,59 @@ class STL3DTrimeshSplitterGUI:
             messagebox.showwarning("Warning", "Load model and analyze split configuration first")
             return
         
-        self.ax.clear()
+        self._split_overlay_active = True
+        self._render_split_overlay()
+    
+    def _render_split_overlay(self):
+        """Draw the model with the current split boxes"""
+        self._clear_scene()
         
         # Draw 3D model first (if available)
         if self.mesh:
-            vertices = self.mesh.vertices
-            faces = self.mesh.faces
-            
-            # Subsample faces for performance
-            max_faces = 2000
-            if len(faces) > max_faces:
-                step = len(faces) // max_faces
-                sampled_faces = faces[::step]
-            else:
-                sampled_faces = faces
-            
-            # Create 3D surface collection
-            from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+            # Subsampled triangles cached at load time - shape (N, 3, 3)
+            triangles = self._sampled_tris
             
-            triangles = []
-            colors = []
-            
-            for face in sampled_faces:
-                triangle = vertices[face]
-                triangles.append(triangle)
-                
-                # Semi-transparent model color
-                colors.append((0.7, 0.7, 0.7, 0.3))  # Light gray, semi-transparent
-            
-            # Render mesh surfaces
-            if triangles:
-                poly_collection = Poly3DCollection(triangles,
-                                                 facecolors=colors,
-                                                 edgecolors='none',  # No edges for cleaner look
-                                                 alpha=0.3)
-                self.ax.add_collection3d(poly_collection)
+            # Render mesh surfaces in a single light gray, semi-transparent color
+            if len(triangles):
+                self._draw_mesh(triangles, (0.7, 0.7, 0.7, 0.3),
+                                edgecolors='none',  # No edges for cleaner look
+                                linewidths=0, alpha=0.3)
         
         # Draw original model bounding box
         min_x, max_x, min_y, max_y, min_z, max_z = self.model_bounds
         
-        vertices = [
-            [min_x, min_y, min_z], [max_x, min_y, min_z],
-            [max_x, max_y, min_z], [min_x, max_y, min_z],
-            [min_x, min_y, max_z], [max_x, min_y, max_z],
-            [max_x, max_y, max_z], [min_x, max_y, max_z]
-        ]
-        
-        edges = [
-            [0, 1], [1, 2], [2, 3], [3, 0],  # bottom
-            [4, 5], [5, 6], [6, 7], [7, 4],  # top
-            [0, 4], [1, 5], [2, 6], [3, 7]   # vertical
-        ]
-        
-        # Draw model outline
-        for edge in edges:
-            points = [vertices[edge[0]], vertices[edge[1]]]
-            xs, ys, zs = zip(*points)
-            self.ax.plot(xs, ys, zs, 'k-', linewidth=2, alpha=0.7)
-        
         # Draw split boundaries with different colors
         colors = ['red', 'blue', 'green', 'orange', 'purple', 'cyan', 'magenta', 'yellow']
         
+        # Model outline and all split boxes share one animated collection so highlighting can restyle and blit
+        segments = box_edge_segments(np.vstack([self.model_bounds, self._split_bounds]))
+        box_colors = [to_rgba('black', 0.7)] + [to_rgba(colors[i % len(colors)], 0.8)
+                                                for i in range(len(self.split_preview))]
+        box_linewidths = [2] + [1.5] * len(self.split_preview)
+        
+        self._split_boxes = Line3DCollection(segments, colors=np.repeat(box_colors, 12, axis=0),
+                                             linewidths=np.repeat(box_linewidths, 12), animated=True)
+        self.ax.add_collection3d(self._split_boxes)
+        
         for i, part in enumerate(self.split_preview):
             x_min, x_max, y_min, y_max, z_min, z_max = part['bounds']
             color = colors[i % len(colors)]
             part_num = part['part_number']
             
-            # Create split box vertices
-            split_vertices = [
-                [x_min, y_min, z_min], [x_max, y_min, z_min],
-                [x_max, y_max, z_min], [x_min, y_max, z_min],
-                [x_min, y_min, z_max], [x_max, y_min, z_max],
-                [x_max, y_max, z_max], [x_min, y_max, z_max]
-            ]
-            
-            # Draw split boundaries
-            for edge in edges:
-                points = [split_vertices[edge[0]], split_vertices[edge[1]]]
-                xs, ys, zs = zip(*points)
-                self.ax.plot(xs, ys, zs, color=color, linewidth=1.5, alpha=0.8)
-            
             # Add part number labels
             center_x = (x_min + x_max) / 2
             center_y = (y_min + y_max) / 2
             center_z = (z_min + z_max) / 2
-            self.ax.text(center_x, center_y, center_z, f'P{part_num}', 
-                        fontsize=8, color=color, weight='bold')
+            label = self.ax.text(center_x, center_y, center_z, f'P{part_num}', 
+                                fontsize=8, color=color, weight='bold', animated=True)
+            self._split_labels.append(label)
         
         self.ax.set_xlabel('X (mm)')
         self.ax.set_ylabel('Y (mm)')
         self.ax.set_zlabel('Z (mm)')
         self.ax.set_title(f'Split Preview ({len(self.split_preview)} parts)')
+        self.ax.title.set_animated(True)
+        self._overlay_source = self.split_preview
         
         # Set axis limits with padding
         padding = 20
@@ -618,78 +901,50 @@ class STL3DTrimeshSplitterGUI:
         
         self.ax.view_init(elev=20, azim=45)
         self.ax.grid(True, alpha=0.3)
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def set_isometric_view(self):
         """Set isometric camera angle"""
         if self.model_bounds:
             self.ax.view_init(elev=20, azim=45)
-            self.canvas.draw()
+            self.canvas.draw_idle()
     
     def set_top_view(self):
         """Set top-down camera angle"""
         if self.model_bounds:
             self.ax.view_init(elev=90, azim=0)
-            self.canvas.draw()
+            self.canvas.draw_idle()
     
     def set_side_view(self):
         """Set side camera angle"""
         if self.model_bounds:
             self.ax.view_init(elev=0, azim=0)
-            self.canvas.draw()
+            self.canvas.draw_idle()
     
     def highlight_part(self, part_bounds, part_number):
         """Highlight a specific part in the 3D view"""
         if not self.mesh or not self.model_bounds:
             return
         
-        self.ax.clear()
-        
-        # Get mesh geometry for visualization
-        vertices = self.mesh.vertices
-        faces = self.mesh.faces
-        
-        # Subsample faces for performance
-        max_faces = 2000
-        if len(faces) > max_faces:
-            step = len(faces) // max_faces
-            sampled_faces = faces[::step]
-        else:
-            sampled_faces = faces
-        
-        # Create 3D surface collection
-        from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+        self._split_overlay_active = False
+        self._clear_scene()
         
-        triangles = []
-        colors = []
+        # Subsampled triangles cached at load time - shape (N, 3, 3)
+        triangles = self._sampled_tris
         
+        # Check which face centers fall inside the highlighted part
         x_min, x_max, y_min, y_max, z_min, z_max = part_bounds
+        part_min = np.array([x_min, y_min, z_min])
+        part_max = np.array([x_max, y_max, z_max])
+        in_part = ((self._sampled_centroids >= part_min) & (self._sampled_centroids <= part_max)).all(axis=1)
         
-        for face in sampled_faces:
-            triangle = vertices[face]
-            triangles.append(triangle)
-            
-            # Check if this face is in the highlighted part
-            face_center = np.mean(triangle, axis=0)
-            in_part = (x_min <= face_center[0] <= x_max and 
-                      y_min <= face_center[1] <= y_max and 
-                      z_min <= face_center[2] <= z_max)
-            
-            if in_part:
-                # Highlight this part in bright color
-                colors.append((1.0, 0.2, 0.2, 0.9))  # Bright red
-            else:
-                # Dim other parts
-                colors.append((0.3, 0.3, 0.3, 0.3))  # Gray, transparent
+        colors = np.empty((len(triangles), 4))
+        colors[in_part] = (1.0, 0.2, 0.2, 0.9)  # Bright red
+        colors[~in_part] = (0.3, 0.3, 0.3, 0.3)  # Gray, transparent
         
         # Render mesh surfaces
-        if triangles:
-            poly_collection = Poly3DCollection(triangles,
-                                             facecolors=colors,
-                                             edgecolors='navy',
-                                             linewidths=0.1,
-                                             alpha=0.8)
-            self.ax.add_collection3d(poly_collection)
+        if len(triangles):
+            self._draw_mesh(triangles, colors, edgecolors='navy', linewidths=0.1, alpha=0.8)
         
         # Configure 3D plot appearance
         self.ax.set_xlabel('X (mm)')
@@ -724,87 +979,28 @@ class STL3DTrimeshSplitterGUI:
         
         self.ax.view_init(elev=20, azim=45)
         self.ax.grid(True, alpha=0.3)
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
-    def show_split_preview_with_highlight(self, highlighted_part_bounds=None, highlighted_part_num=None):
+    def show_split_preview_with_highlight(self, highlighted_part_num=None):
         """Show split preview with optional part highlighting and 3D model"""
         if not self.split_preview or not self.model_bounds:
             messagebox.showwarning("Warning", "Load model and analyze split configuration first")
             return
         
-        self.ax.clear()
+        # Build the full scene only once per split configuration
+        if self._split_boxes is None or self._overlay_source is not self.split_preview:
+            self.show_split_preview()
         
-        # Draw 3D model first (if available)
-        if self.mesh:
-            vertices = self.mesh.vertices
-            faces = self.mesh.faces
-            
-            # Subsample faces for performance
-            max_faces = 2000
-            if len(faces) > max_faces:
-                step = len(faces) // max_faces
-                sampled_faces = faces[::step]
-            else:
-                sampled_faces = faces
-            
-            # Create 3D surface collection
-            from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-            
-            triangles = []
-            colors = []
-            
-            for face in sampled_faces:
-                triangle = vertices[face]
-                triangles.append(triangle)
-                
-                # Semi-transparent model color
-                colors.append((0.7, 0.7, 0.7, 0.3))  # Light gray, semi-transparent
-            
-            # Render mesh surfaces
-            if triangles:
-                poly_collection = Poly3DCollection(triangles,
-                                                 facecolors=colors,
-                                                 edgecolors='none',  # No edges for cleaner look
-                                                 alpha=0.3)
-                self.ax.add_collection3d(poly_collection)
-        
-        # Draw original model bounding box
-        min_x, max_x, min_y, max_y, min_z, max_z = self.model_bounds
-        
-        vertices = [
-            [min_x, min_y, min_z], [max_x, min_y, min_z],
-            [max_x, max_y, min_z], [min_x, max_y, min_z],
-            [min_x, min_y, max_z], [max_x, min_y, max_z],
-            [max_x, max_y, max_z], [min_x, max_y, max_z]
-        ]
-        
-        edges = [
-            [0, 1], [1, 2], [2, 3], [3, 0],  # bottom
-            [4, 5], [5, 6], [6, 7], [7, 4],  # top
-            [0, 4], [1, 5], [2, 6], [3, 7]   # vertical
-        ]
-        
-        # Draw model outline
-        for edge in edges:
-            points = [vertices[edge[0]], vertices[edge[1]]]
-            xs, ys, zs = zip(*points)
-            self.ax.plot(xs, ys, zs, 'k-', linewidth=2, alpha=0.7)
-        
-        # Draw split boundaries with different colors
+        # Restyle split boundaries in place
         colors = ['red', 'blue', 'green', 'orange', 'purple', 'cyan', 'magenta', 'yellow']
+        part_colors = []
+        part_linewidths = []
         
         for i, part in enumerate(self.split_preview):
-            x_min, x_max, y_min, y_max, z_min, z_max = part['bounds']
             part_num = part['part_number']
             
             # Check if this is the highlighted part
-            is_highlighted = (highlighted_part_bounds and 
-                            abs(x_min - highlighted_part_bounds[0]) < 0.1 and
-                            abs(x_max - highlighted_part_bounds[1]) < 0.1 and
-                            abs(y_min - highlighted_part_bounds[2]) < 0.1 and
-                            abs(y_max - highlighted_part_bounds[3]) < 0.1 and
-                            abs(z_min - highlighted_part_bounds[4]) < 0.1 and
-                            abs(z_max - highlighted_part_bounds[5]) < 0.1)
+            is_highlighted = part_num == highlighted_part_num
             
             if is_highlighted:
                 color = 'lime'  # Bright green for highlighted part
@@ -815,31 +1011,22 @@ class STL3DTrimeshSplitterGUI:
                 linewidth = 1.5
                 alpha = 0.8
             
-            # Create split box vertices
-            split_vertices = [
-                [x_min, y_min, z_min], [x_max, y_min, z_min],
-                [x_max, y_max, z_min], [x_min, y_max, z_min],
-                [x_min, y_min, z_max], [x_max, y_min, z_max],
-                [x_max, y_max, z_max], [x_min, y_max, z_max]
-            ]
-            
-            # Draw split boundaries
-            for edge in edges:
-                points = [split_vertices[edge[0]], split_vertices[edge[1]]]
-                xs, ys, zs = zip(*points)
-                self.ax.plot(xs, ys, zs, color=color, linewidth=linewidth, alpha=alpha)
-            
-            # Add part number labels
-            center_x = (x_min + x_max) / 2
-            center_y = (y_min + y_max) / 2
-            center_z = (z_min + z_max) / 2
+            part_colors.append(to_rgba(color, alpha))
+            part_linewidths.append(linewidth)
             
+            # Update part number label
+            label = self._split_labels[i]
+            label.set_color(color)
             if is_highlighted:
-                self.ax.text(center_x, center_y, center_z, f'P{part_num} *', 
-                            fontsize=10, color=color, weight='bold')
+                label.set_text(f'P{part_num} *')
+                label.set_fontsize(10)
             else:
-                self.ax.text(center_x, center_y, center_z, f'P{part_num}', 
-                            fontsize=8, color=color, weight='bold')
+                label.set_text(f'P{part_num}')
+                label.set_fontsize(8)
+        
+        # Each box contributes 12 edge segments to the shared collection, model outline first
+        self._split_boxes.set_color(np.repeat([to_rgba('black', 0.7)] + part_colors, 12, axis=0))
+        self._split_boxes.set_linewidth(np.repeat([2] + part_linewidths, 12))
         
         # Set title
         if highlighted_part_num:
@@ -847,19 +1034,7 @@ class STL3DTrimeshSplitterGUI:
         else:
             self.ax.set_title(f'Split Preview ({len(self.split_preview)} parts)')
         
-        self.ax.set_xlabel('X (mm)')
-        self.ax.set_ylabel('Y (mm)')
-        self.ax.set_zlabel('Z (mm)')
-        
-        # Set axis limits with padding
-        padding = 20
-        self.ax.set_xlim(min_x - padding, max_x + padding)
-        self.ax.set_ylim(min_y - padding, max_y + padding)
-        self.ax.set_zlim(min_z - padding, max_z + padding)
-        
-        self.ax.view_init(elev=20, azim=45)
-        self.ax.grid(True, alpha=0.3)
-        self.canvas.draw()
+        self._blit_split_overlay()
     
     def start_splitting(self):
         """Begin mesh splitting operation"""
@@ -876,7 +1051,7 @@ class STL3DTrimeshSplitterGUI:
         thread.start()
     
     def _split_model_thread(self):
-        """Execute mesh splitting using proper intersection method"""
+        """Execute mesh splitting by clipping each part out of the mesh"""
         try:
             self.split_button.configure(state='disabled')
             self.progress.configure(mode='determinate', maximum=len(self.split_preview))
@@ -896,120 +1071,57 @@ class STL3DTrimeshSplitterGUI:
             
             # Show grid preview first
             self.root.after(0, self.show_split_preview)
-            import time
             time.sleep(0.5)  # Show grid for 0.5 seconds
             
-            # Process each split segment using proper intersection
-            for i, part in enumerate(self.split_preview):
-                x_min, x_max, y_min, y_max, z_min, z_max = part['bounds']
-                part_num = part['part_number']
-                
-                # Update progress and status
-                self.root.after(0, lambda p=i+1: self.progress.configure(value=p))
-                self.root.after(0, lambda p=part_num: self.status_label.configure(
-                    text=f"Processing part {p}...", foreground="orange"))
-                
-                # Show part preview animation with grid
-                self.root.after(0, lambda bounds=part['bounds'], num=part_num: 
-                              self.show_split_preview_with_highlight(bounds, num))
-                
-                # Force GUI update
-                self.root.after(0, self.root.update)
+            # Dense copies of the mesh arrays, read once instead of through trimesh properties
+            vertices = np.ascontiguousarray(self.mesh.vertices, dtype=np.float64)
+            faces = np.ascontiguousarray(self.mesh.faces, dtype=np.int64)
+            
+            # Each part is independent - cut them in parallel worker processes
+            with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_split_worker,
+                                     initargs=(vertices, faces, self._face_bounds)) as executor:
+                futures = []
                 
-                print(f"Processing part {part_num}: bounds ({x_min:.1f}, {y_min:.1f}, {z_min:.1f}) to ({x_max:.1f}, {y_max:.1f}, {z_max:.1f})")
+                for part in self.split_preview:
+                    part_num = part['part_number']
+                    
+                    # Skip the part entirely when no triangle's bounding box reaches it
+                    if not faces_overlapping(self._face_bounds, *part['bounds']).any():
+                        print(f"Part {part_num}: No geometry in bounds - skipped")
+                        continue
+                    
+                    output_filename = f"{base_name}_part_{part_num:02d}.stl"
+                    futures.append(executor.submit(_process_part, part['bounds'], part_num,
+                                                   os.path.join(output_path, output_filename)))
                 
-                try:
-                    # Try intersection method first (for watertight models)
-                    try:
-                        # Create bounding box for this part
-                        bounds_box = trimesh.creation.box(
-                            extents=(x_max - x_min, y_max - y_min, z_max - z_min),
-                            transform=trimesh.transformations.translation_matrix(
-                                [(x_max + x_min) / 2, (y_max + y_min) / 2, (z_max + z_min) / 2]
-                            )
-                        )
-                        
-                        # Intersect the mesh with the bounding box
-                        section = self.mesh.intersection(bounds_box)
-                        
-                        # Check if the section contains geometry
-                        if section.is_empty:
-                            print(f"Part {part_num}: No geometry in bounds - skipped")
-                            # Wait a bit to show the preview
-                            import time
-                            time.sleep(0.01)
-                            continue
-                        
-                        # Export the part
-                        output_filename = f"{base_name}_part_{part_num:02d}.stl"
-                        output_filepath = os.path.join(output_path, output_filename)
-                        
-                        # Use trimesh export
-                        section.export(output_filepath)
-                        parts_created += 1
-                        
-                        print(f"Part {part_num}: SUCCESS - {len(section.faces)} triangles, {len(section.vertices)} vertices → {output_filename}")
-                        
-                        # Wait a bit to show the preview
-                        import time
-                        time.sleep(0.01)
-                        
-                    except Exception as intersection_error:
-                        # Fallback to vertex filtering method for non-watertight models
-                        print(f"Part {part_num}: Intersection failed ({intersection_error}), trying fallback method...")
-                        
-                        # Get original mesh data
-                        original_vertices = self.mesh.vertices
-                        original_faces = self.mesh.faces
-                        
-                        # Find faces that have at least one vertex in the bounds
-                        valid_faces = []
-                        
-                        for face_idx, face in enumerate(original_faces):
-                            face_vertices = original_vertices[face]
-                            
-                            # Check if any vertex of this face is within bounds
-                            for vertex in face_vertices:
-                                vx, vy, vz = vertex
-                                if (x_min <= vx <= x_max and 
-                                    y_min <= vy <= y_max and 
-                                    z_min <= vz <= z_max):
-                                    valid_faces.append(face_idx)
-                                    break
-                        
-                        if not valid_faces:
-                            print(f"Part {part_num}: No faces found in bounds - skipped")
-                            import time
-                            time.sleep(0.01)
-                            continue
-                        
-                        # Extract valid faces and their vertices
-                        part_faces = original_faces[valid_faces]
-                        
-                        # Get all unique vertices used by these faces
-                        unique_vertex_indices = np.unique(part_faces.flatten())
-                        part_vertices = original_vertices[unique_vertex_indices]
-                        
-                        # Reindex faces to use new vertex indices
-                        vertex_map = {old_idx: new_idx for new_idx, old_idx in enumerate(unique_vertex_indices)}
-                        reindexed_faces = np.array([[vertex_map[vertex] for vertex in face] for face in part_faces])
-                        
-                        # Export the part using simple STL writer
-                        output_filename = f"{base_name}_part_{part_num:02d}.stl"
-                        output_filepath = os.path.join(output_path, output_filename)
-                        
-                        self.write_stl_simple(output_filepath, part_vertices, reindexed_faces)
-                        parts_created += 1
-                        
-                        print(f"Part {part_num}: SUCCESS (fallback) - {len(reindexed_faces)} triangles, {len(part_vertices)} vertices → {output_filename}")
-                        
-                        # Wait a bit to show the preview
-                        import time
-                        time.sleep(0.01)
+                # Collect results as parts finish
+                skipped = len(self.split_preview) - len(futures)
+                last_ui = 0.0
+                for i, future in enumerate(as_completed(futures), start=skipped + 1):
+                    result = future.result()
+                    part_num = result['part_number']
                     
-                except Exception as part_error:
-                    print(f"Error processing part {part_num}: {part_error}")
-                    continue
+                    # Update progress, status and part preview at most ~10 times per second
+                    now = time.monotonic()
+                    if now - last_ui > 0.1:
+                        self.root.after(0, self._batched_ui_update, i, part_num)
+                        last_ui = now
+                    
+                    if result['error']:
+                        print(f"Error processing part {part_num}: {result['error']}")
+                    elif result['method'] is None:
+                        print(f"Part {part_num}: No geometry in bounds - skipped")
+                    else:
+                        parts_created += 1
+                        method = " (fallback)" if result['method'] == 'fallback' else ""
+                        print(f"Part {part_num}: SUCCESS{method} - {result['triangles']} triangles, "
+                              f"{result['vertices']} vertices → {os.path.basename(result['filename'])}")
+            
+            # Final state is always shown, even if throttled away above
+            if futures:
+                self.root.after(0, self._batched_ui_update, len(self.split_preview), part_num)
             
             # Show final result and return to full model view
             self.root.after(0, self.refresh_3d_view)
@@ -1033,41 +1145,43 @@ class STL3DTrimeshSplitterGUI:
             self.split_button.configure(state='normal')
             self.status_label.configure(text="Ready", foreground="green")
 
+    def _batched_ui_update(self, progress_value, part_num):
+        """Apply one coalesced progress, status and highlight update from the split thread"""
+        self.progress.configure(value=progress_value)
+        self.status_label.configure(text=f"Processed part {part_num}...", foreground="orange")
+        self.show_split_preview_with_highlight(part_num)
+    
+    def _load_binary_stl_fast(self, filename):
+        """Parse binary STL straight into numpy arrays, None if not binary STL"""
+        with open(filename, 'rb') as f:
+            header = f.read(84)
+            if len(header) < 84:
+                return None
+            
+            count = struct.unpack('<I', header[80:84])[0]
+        
+        # Binary STL has exactly 50 bytes per triangle after the header
+        if count == 0 or os.path.getsize(filename) != 84 + count * 50:
+            return None
+        
+        # Map the triangle table instead of reading it - pages load on demand
+        triangles = np.memmap(filename, dtype=STL_TRIANGLE_DTYPE, mode='r', offset=84, shape=(count,))
+        # Adding 0.0 turns -0.0 into 0.0 so both signs of zero share one byte pattern
+        corners = np.ascontiguousarray(triangles['vertices']).reshape(-1, 3) + np.float32(0.0)
+        del triangles
+        
+        # Merge identical corners so shared edges stay connected (watertight check)
+        _, first_index, inverse = np.unique(corners.view(np.dtype((np.void, 12))).ravel(),
+                                            return_index=True, return_inverse=True)
+        
+        vertices = corners[first_index].astype(np.float64)
+        faces = inverse.reshape(-1, 3)
+        
+        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    
     def write_stl_simple(self, filename, vertices, faces):
         """Simple STL writer as fallback"""
-        with open(filename, 'wb') as f:
-            # Write header
-            header = f'STL Part - {len(faces)} triangles'.encode('ascii')[:80]
-            header = header.ljust(80, b'\0')
-            f.write(header)
-            
-            # Write number of triangles
-            f.write(struct.pack('<I', len(faces)))
-            
-            # Write each triangle
-            for face in faces:
-                v1, v2, v3 = vertices[face]
-                
-                # Calculate normal vector
-                edge1 = v2 - v1
-                edge2 = v3 - v1
-                normal = np.cross(edge1, edge2)
-                norm = np.linalg.norm(normal)
-                if norm > 0:
-                    normal = normal / norm
-                else:
-                    normal = np.array([0.0, 0.0, 1.0])
-                
-                # Write normal
-                f.write(struct.pack('<fff', *normal))
-                
-                # Write vertices
-                f.write(struct.pack('<fff', *v1))
-                f.write(struct.pack('<fff', *v2))
-                f.write(struct.pack('<fff', *v3))
-                
-                # Write attribute bytes
-                f.write(struct.pack('<H', 0))
+        write_stl_simple(filename, vertices, faces)
 
 def main():
     """Application entry point"""
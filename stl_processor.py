@@ -7,8 +7,9 @@ Used by PHP backend to process STL files
 import sys
 import os
 import numpy as np
-import struct
 import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -19,20 +20,107 @@ except ImportError:
     print("ERROR: Missing trimesh library! Install: pip install trimesh")
     sys.exit(1)
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+# Below this many faces the host-device transfer costs more than the GPU saves
+GPU_MIN_FACES = 200_000
+
+# Bumped whenever the welded mesh changes, so stale .cache.npz sidecars are rebuilt
+MESH_CACHE_VERSION = 3
+
+# On-disk layout of one binary STL triangle (50 bytes)
+STL_TRIANGLE_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attributes', '<u2')
+])
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def faces_in_box(vertices, faces, candidates, x_min, x_max, y_min, y_max, z_min, z_max):
+        """Mask over candidates of faces with at least one vertex inside the box, in a single fused pass"""
+        mask = np.zeros(candidates.shape[0], dtype=np.bool_)
+        for i in prange(candidates.shape[0]):
+            for k in range(3):
+                vertex = faces[candidates[i], k]
+                x, y, z = vertices[vertex, 0], vertices[vertex, 1], vertices[vertex, 2]
+                if x_min <= x <= x_max and y_min <= y <= y_max and z_min <= z <= z_max:
+                    mask[i] = True
+                    break
+        return mask
+else:
+    def faces_in_box(vertices, faces, candidates, x_min, x_max, y_min, y_max, z_min, z_max):
+        """Mask over candidates of faces with at least one vertex inside the box"""
+        corners = vertices[faces[candidates]]
+        part_min = np.array([x_min, y_min, z_min])
+        part_max = np.array([x_max, y_max, z_max])
+        return ((corners >= part_min) & (corners <= part_max)).all(axis=2).any(axis=1)
+
+# Processor holding the mesh being split, rebuilt once in each worker process
+_worker_processor = None
+
+def _init_tile_worker(vertices, faces, force_fallback, verbose):
+    """Process pool initializer - receive the mesh arrays once per worker"""
+    global _worker_processor
+    _worker_processor = STLProcessor(verbose=verbose)
+    _worker_processor.mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    _worker_processor.force_fallback = force_fallback
+    _worker_processor._cache_arrays()
+
+def _process_tile(task):
+    """Split one tile in a worker process"""
+    return _worker_processor._split_tile(*task)
+
+def verbosity_from_env():
+    """Output level from STL_VERBOSE - 1 (load/split summary) unless set to a valid integer"""
+    try:
+        return int(os.environ.get('STL_VERBOSE', '1'))
+    except ValueError:
+        print(f"WARNING: Ignoring invalid STL_VERBOSE={os.environ['STL_VERBOSE']!r}, using 1")
+        return 1
+
 class STLProcessor:
-    def __init__(self):
+    def __init__(self, verbose=None):
         self.mesh = None
         self.model_bounds = None
         self.force_fallback = False
+        # STL_VERBOSE=2 adds per-tile progress to the load/split summary
+        self.verbose = verbosity_from_env() if verbose is None else verbose
+        self.vertices = None
+        self.faces = None
+        self.face_min = None
+        self.face_max = None
+        self.watertight = None
+        self.volume = None
         
     def load_stl(self, filepath, flip_model=False):
         """Load STL file and optionally flip it"""
         try:
             print(f"Loading file: {filepath}")
-            self.mesh = trimesh.load(filepath)
             
-            if not isinstance(self.mesh, trimesh.Trimesh):
-                raise ValueError("Failed to load STL file as valid 3D mesh")
+            # Reuse the parsed mesh from an earlier run (e.g. info before split) when the file is unchanged
+            if not self._load_cache(filepath):
+                # Skip trimesh's full cleanup pass - only shared corners need merging
+                self.mesh = trimesh.load(filepath, process=False, validate=False)
+                
+                if not isinstance(self.mesh, trimesh.Trimesh):
+                    raise ValueError("Failed to load STL file as valid 3D mesh")
+                
+                self._merge_corners()
+                
+                self.watertight = self.mesh.is_watertight
+                self.volume = self.mesh.volume
+                self._save_cache(filepath)
             
             # Apply rotation if requested
             if flip_model:
@@ -40,8 +128,11 @@ class STLProcessor:
                 rotation_matrix = trimesh.transformations.rotation_matrix(np.pi, [1, 0, 0])
                 self.mesh.apply_transform(rotation_matrix)
             
-            # Calculate model bounds
-            bounds = self.mesh.bounds
+            self._cache_arrays()
+            
+            # Calculate model bounds from the float32 copy the fallback tests against - the float64
+            # mesh carries rotation noise the cast removes, so its bounds can miss faces on the outer planes
+            bounds = np.array([self.vertices.min(axis=0), self.vertices.max(axis=0)], dtype=np.float64)
             self.model_bounds = (bounds[0][0], bounds[1][0], 
                                bounds[0][1], bounds[1][1],
                                bounds[0][2], bounds[1][2])
@@ -52,45 +143,28 @@ class STLProcessor:
             
             print(f"Model loaded: {width:.1f}×{depth:.1f}×{height:.1f} mm")
             print(f"Triangles: {len(self.mesh.faces)}, Vertices: {len(self.mesh.vertices)}")
-            print(f"Watertight: {self.mesh.is_watertight}")
-            print(f"Volume: {self.mesh.volume:.2f} mm³")
+            print(f"Watertight: {self.watertight}")
+            print(f"Volume: {self.volume:.2f} mm³")
             
-            # Test trimesh capabilities
+            # Test trimesh capabilities - capped slicing of a unit cube needs the same
+            # extras (scipy, shapely, a triangulation engine) as cutting the model
             try:
-                test_box = trimesh.creation.box(extents=[10, 10, 10])
-                test_intersection = self.mesh.intersection(test_box)
-                print(f"Trimesh intersection test: SUCCESS - {len(test_intersection.faces)} faces")
-                
-                # Test with actual model bounds
-                model_box = trimesh.creation.box(
-                    extents=(width, depth, height),
-                    transform=trimesh.transformations.translation_matrix([
-                        (bounds[0][0] + bounds[1][0]) / 2,
-                        (bounds[0][1] + bounds[1][1]) / 2,
-                        (bounds[0][2] + bounds[1][2]) / 2
-                    ])
-                )
-                model_intersection = self.mesh.intersection(model_box)
-                print(f"Model intersection test: SUCCESS - {len(model_intersection.faces)} faces")
-                
-                # Test if intersection creates watertight results
-                if hasattr(test_intersection, 'is_watertight'):
-                    print(f"Test intersection watertight: {test_intersection.is_watertight}")
-                if hasattr(model_intersection, 'is_watertight'):
-                    print(f"Model intersection watertight: {model_intersection.is_watertight}")
+                test_box = trimesh.creation.box(extents=[1, 1, 1])
+                test_slice = test_box.slice_plane([0, 0, 0], [1, 0, 0], cap=True)
+                print(f"Trimesh slicing test: SUCCESS - {len(test_slice.faces)} faces, watertight: {test_slice.is_watertight}")
                 
             except Exception as e:
-                print(f"Trimesh intersection test: FAILED - {e}")
+                print(f"Trimesh slicing test: FAILED - {e}")
                 print(f"Error type: {type(e).__name__}")
                 import traceback
                 print(f"Traceback: {traceback.format_exc()}")
                 
-                # If intersection fails, force fallback method
-                print("WARNING: Intersection method not available - will use fallback method only")
+                # If slicing fails, force fallback method
+                print("WARNING: Plane clipping not available - will use fallback method only")
                 self.force_fallback = True
             
-            if not self.mesh.is_watertight:
-                print("WARNING: Model is not watertight - will use fallback method for splitting")
+            if not self.watertight:
+                print("WARNING: Model is not watertight - cut faces may not close cleanly")
             
             return True
             
@@ -98,6 +172,63 @@ class STLProcessor:
             print(f"Error loading model: {e}")
             return False
     
+    def _cache_arrays(self):
+        """Plain float32/uint32 copies of the mesh - STL precision, half the bandwidth of trimesh's float64"""
+        self.vertices = np.ascontiguousarray(self.mesh.vertices, dtype=np.float32)
+        self.faces = np.ascontiguousarray(self.mesh.faces, dtype=np.uint32)
+    
+    def _merge_corners(self):
+        """Weld bit-identical vertices so shared edges stay connected (watertight check, slicing caps)"""
+        # Adding 0.0 turns -0.0 into 0.0 so both signs of zero share one byte pattern
+        vertices = np.ascontiguousarray(self.mesh.vertices) + 0.0
+        _, first_index, inverse = np.unique(vertices.view(np.dtype((np.void, vertices.itemsize * 3))).ravel(),
+                                            return_index=True, return_inverse=True)
+        
+        faces = inverse.reshape(-1)[self.mesh.faces]
+        self.mesh = trimesh.Trimesh(vertices=vertices[first_index], faces=faces, process=False)
+    
+    def _load_cache(self, filepath):
+        """Restore the mesh from its .cache.npz sidecar if it matches the file, False otherwise"""
+        cache_path = filepath + '.cache.npz'
+        if not os.path.exists(cache_path):
+            return False
+        
+        try:
+            stat = os.stat(filepath)
+            with np.load(cache_path) as cache:
+                if ('version' not in cache or cache['version'][0] != MESH_CACHE_VERSION
+                        or cache['mtime'][0] != stat.st_mtime_ns or cache['size'][0] != stat.st_size):
+                    return False
+                
+                self.mesh = trimesh.Trimesh(vertices=cache['v'], faces=cache['f'], process=False)
+                self.watertight = bool(cache['watertight'][0])
+                self.volume = float(cache['volume'][0])
+            
+            print("Loaded mesh from cache")
+            return True
+            
+        except Exception as e:
+            print(f"WARNING: Ignoring unreadable mesh cache ({e})")
+            return False
+    
+    def _save_cache(self, filepath):
+        """Write the parsed mesh next to the STL so later runs skip parsing"""
+        try:
+            stat = os.stat(filepath)
+            
+            # Vertices stay float64 - ASCII STL coordinates need not be float32-representable
+            with open(filepath + '.cache.npz', 'wb') as f:
+                np.savez(f,
+                         v=np.asarray(self.mesh.vertices, dtype=np.float64),
+                         f=self.mesh.faces.astype(np.uint32),
+                         watertight=np.array([self.watertight]),
+                         volume=np.array([self.volume]),
+                         version=np.array([MESH_CACHE_VERSION]),
+                         mtime=np.array([stat.st_mtime_ns]),
+                         size=np.array([stat.st_size]))
+        except Exception as e:
+            print(f"WARNING: Could not write mesh cache ({e})")
+    
     def calculate_splits(self, model_size, max_size):
         """Calculate number of splits required for given dimension"""
         if max_size is None or max_size <= 0:
@@ -136,174 +267,40 @@ class STLProcessor:
             # Z extent is just the full range
             z_min, z_max = min_z, max_z_bound
             
-            parts_created = 0
-            part_number = 1
+            # Per-face bounding boxes, computed once and shared by every tile
+            self._compute_face_bounds()
+            
+            # Bucket faces by the tiles they overlap so each tile reads only its own faces
+            tile_faces = self._bucket_faces(x_extent, y_extent)
             
             print(f"Starting split operation on {len(self.mesh.faces)} triangles")
             
+            # Each tile is independent - cut them in parallel worker processes
+            tasks = []
             for i in range(xsplit):
                 for j in range(ysplit):
-                    x_min = x_extent[i]
-                    x_max = x_extent[i + 1] 
-                    y_min = y_extent[j]
-                    y_max = y_extent[j + 1]
-                    
-                    print(f"Processing part {part_number}: bounds ({x_min:.1f}, {y_min:.1f}, {z_min:.1f}) to ({x_max:.1f}, {y_max:.1f}, {z_max:.1f})")
-                    
-                    try:
-                        print(f"Part {part_number}: Processing bounds ({x_min:.1f}, {y_min:.1f}, {z_min:.1f}) to ({x_max:.1f}, {y_max:.1f}, {z_max:.1f})")
-                        
-                        # Try intersection method first (for watertight models) - unless forced to use fallback
-                        if not self.force_fallback:
-                            try:
-                                print(f"Part {part_number}: Trying intersection method...")
-                                
-                                # Create bounding box for this part
-                                bounds_box = trimesh.creation.box(
-                                    extents=(x_max - x_min, y_max - y_min, z_max - z_min),
-                                    transform=trimesh.transformations.translation_matrix(
-                                        [(x_max + x_min) / 2, (y_max + y_min) / 2, (z_max + z_min) / 2]
-                                    )
-                                )
-                                
-                                print(f"Part {part_number}: Created bounding box, attempting intersection...")
-                                
-                                # Intersect the mesh with the bounding box
-                                section = self.mesh.intersection(bounds_box)
-                                
-                                print(f"Part {part_number}: Intersection completed, checking if empty...")
-                                
-                                # Check if the section contains geometry
-                                if section.is_empty:
-                                    print(f"Part {part_number}: No geometry in bounds - skipped")
-                                    continue
-                                
-                                print(f"Part {part_number}: Section has {len(section.faces)} faces, {len(section.vertices)} vertices")
-                                
-                                # Export the part
-                                output_filename = f"part_{part_number:02d}.stl"
-                                output_filepath = os.path.join(output_dir, output_filename)
-                                
-                                # Use trimesh export
-                                section.export(output_filepath)
-                                parts_created += 1
-                                
-                                print(f"Part {part_number}: SUCCESS (intersection) - {len(section.faces)} triangles, {len(section.vertices)} vertices → {output_filename}")
-                                
-                            except Exception as intersection_error:
-                                # Fallback to vertex filtering method for non-watertight models
-                                print(f"Part {part_number}: Intersection failed ({intersection_error}), trying fallback method...")
-                                print(f"Part {part_number}: Error type: {type(intersection_error).__name__}")
-                                
-                                # Get original mesh data
-                                original_vertices = self.mesh.vertices
-                                original_faces = self.mesh.faces
-                                
-                                print(f"Part {part_number}: Original mesh has {len(original_faces)} faces, {len(original_vertices)} vertices")
-                                
-                                # Find faces that have at least one vertex in the bounds
-                                valid_faces = []
-                                
-                                for face_idx, face in enumerate(original_faces):
-                                    face_vertices = original_vertices[face]
-                                    
-                                    # Check if any vertex of this face is within bounds
-                                    for vertex in face_vertices:
-                                        vx, vy, vz = vertex
-                                        if (x_min <= vx <= x_max and 
-                                            y_min <= vy <= y_max and 
-                                            z_min <= vz <= z_max):
-                                            valid_faces.append(face_idx)
-                                            break
-                                
-                                print(f"Part {part_number}: Found {len(valid_faces)} valid faces in bounds")
-                                
-                                if not valid_faces:
-                                    print(f"Part {part_number}: No faces found in bounds - skipped")
-                                    continue
-                                
-                                # Extract valid faces and their vertices
-                                part_faces = original_faces[valid_faces]
-                                
-                                # Get all unique vertices used by these faces
-                                unique_vertex_indices = np.unique(part_faces.flatten())
-                                part_vertices = original_vertices[unique_vertex_indices]
-                                
-                                # Reindex faces to use new vertex indices
-                                vertex_map = {old_idx: new_idx for new_idx, old_idx in enumerate(unique_vertex_indices)}
-                                reindexed_faces = np.array([[vertex_map[vertex] for vertex in face] for face in part_faces])
-                                
-                                print(f"Part {part_number}: Extracted {len(reindexed_faces)} faces, {len(part_vertices)} vertices")
-                                
-                                # Export the part using simple STL writer
-                                output_filename = f"part_{part_number:02d}.stl"
-                                output_filepath = os.path.join(output_dir, output_filename)
-                                
-                                self.write_stl_simple(output_filepath, part_vertices, reindexed_faces)
-                                parts_created += 1
-                                
-                                print(f"Part {part_number}: SUCCESS (fallback) - {len(reindexed_faces)} triangles, {len(part_vertices)} vertices → {output_filename}")
-                        
-                        else:
-                            # Force fallback method (intersection not available)
-                            print(f"Part {part_number}: Using fallback method (intersection not available)...")
-                            
-                            # Get original mesh data
-                            original_vertices = self.mesh.vertices
-                            original_faces = self.mesh.faces
-                            
-                            print(f"Part {part_number}: Original mesh has {len(original_faces)} faces, {len(original_vertices)} vertices")
-                            
-                            # Find faces that have at least one vertex in the bounds
-                            valid_faces = []
-                            
-                            for face_idx, face in enumerate(original_faces):
-                                face_vertices = original_vertices[face]
-                                
-                                # Check if any vertex of this face is within bounds
-                                for vertex in face_vertices:
-                                    vx, vy, vz = vertex
-                                    if (x_min <= vx <= x_max and 
-                                        y_min <= vy <= y_max and 
-                                        z_min <= vz <= z_max):
-                                        valid_faces.append(face_idx)
-                                        break
-                            
-                            print(f"Part {part_number}: Found {len(valid_faces)} valid faces in bounds")
-                            
-                            if not valid_faces:
-                                print(f"Part {part_number}: No faces found in bounds - skipped")
-                                continue
-                            
-                            # Extract valid faces and their vertices
-                            part_faces = original_faces[valid_faces]
-                            
-                            # Get all unique vertices used by these faces
-                            unique_vertex_indices = np.unique(part_faces.flatten())
-                            part_vertices = original_vertices[unique_vertex_indices]
-                            
-                            # Reindex faces to use new vertex indices
-                            vertex_map = {old_idx: new_idx for new_idx, old_idx in enumerate(unique_vertex_indices)}
-                            reindexed_faces = np.array([[vertex_map[vertex] for vertex in face] for face in part_faces])
-                            
-                            print(f"Part {part_number}: Extracted {len(reindexed_faces)} faces, {len(part_vertices)} vertices")
-                            
-                            # Export the part using simple STL writer
-                            output_filename = f"part_{part_number:02d}.stl"
-                            output_filepath = os.path.join(output_dir, output_filename)
-                            
-                            self.write_stl_simple(output_filepath, part_vertices, reindexed_faces)
-                            parts_created += 1
-                            
-                            print(f"Part {part_number}: SUCCESS (forced fallback) - {len(reindexed_faces)} triangles, {len(part_vertices)} vertices → {output_filename}")
-                        
-                    except Exception as part_error:
-                        print(f"Error processing part {part_number}: {part_error}")
-                        import traceback
-                        print(f"Part {part_number}: Traceback: {traceback.format_exc()}")
-                        continue
-                    
-                    part_number += 1
+                    tile_bounds = (x_extent[i], x_extent[i + 1], y_extent[j], y_extent[j + 1], z_min, z_max)
+                    tasks.append((i, j, xsplit, ysplit, tile_bounds, i * ysplit + j + 1, output_dir, tile_faces[i][j]))
+            
+            with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                     mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_tile_worker,
+                                     initargs=(np.asarray(self.mesh.vertices), np.asarray(self.mesh.faces),
+                                               self.force_fallback, self.verbose)) as executor:
+                tile_files = list(executor.map(_process_tile, tasks))
+            
+            # Number the created parts consecutively, skipping empty tiles
+            parts_created = 0
+            for tile_file in tile_files:
+                if tile_file is None:
+                    continue
+                
+                parts_created += 1
+                part_file = os.path.join(output_dir, f"part_{parts_created:02d}.stl")
+                if tile_file != part_file:
+                    os.replace(tile_file, part_file)
+                    if self.verbose >= 2:
+                        print(f"Renamed {os.path.basename(tile_file)} → {os.path.basename(part_file)}")
             
             print(f"Split operation completed: {parts_created} parts created")
             return parts_created > 0
@@ -312,41 +309,212 @@ class STLProcessor:
             print(f"Error in split_model: {e}")
             return False
     
-    def write_stl_simple(self, filename, vertices, faces):
-        """Simple STL writer as fallback"""
-        with open(filename, 'wb') as f:
-            # Write header
-            header = f'STL Part - {len(faces)} triangles'.encode('ascii')[:80]
-            header = header.ljust(80, b'\0')
-            f.write(header)
+    def _split_tile(self, i, j, xsplit, ysplit, tile_bounds, part_number, output_dir, candidates):
+        """Cut one grid tile out of the mesh and export it, returning the file path or None"""
+        x_min, x_max, y_min, y_max, z_min, z_max = tile_bounds
+        
+        if self.verbose >= 2:
+            print(f"Processing part {part_number}: bounds ({x_min:.1f}, {y_min:.1f}, {z_min:.1f}) to ({x_max:.1f}, {y_max:.1f}, {z_max:.1f})")
+        
+        try:
+            if self.verbose >= 2:
+                print(f"Part {part_number}: Processing bounds ({x_min:.1f}, {y_min:.1f}, {z_min:.1f}) to ({x_max:.1f}, {y_max:.1f}, {z_max:.1f})")
             
-            # Write number of triangles
-            f.write(struct.pack('<I', len(faces)))
+            # Try plane clipping first - unless forced to use fallback
+            if not self.force_fallback:
+                try:
+                    if self.verbose >= 2:
+                        print(f"Part {part_number}: Trying plane clipping method...")
+                    
+                    # Cut planes for this tile - edges on the model bounds have nothing to cut
+                    cut_planes = []
+                    if i > 0:
+                        cut_planes.append(([x_min, 0, 0], [1, 0, 0]))
+                    if i < xsplit - 1:
+                        cut_planes.append(([x_max, 0, 0], [-1, 0, 0]))
+                    if j > 0:
+                        cut_planes.append(([0, y_min, 0], [0, 1, 0]))
+                    if j < ysplit - 1:
+                        cut_planes.append(([0, y_max, 0], [0, -1, 0]))
+                    
+                    if self.verbose >= 2:
+                        print(f"Part {part_number}: Clipping with {len(cut_planes)} planes...")
+                    
+                    # Slice away everything outside the tile, capping each cut to keep it closed
+                    section = self.mesh
+                    for plane_origin, plane_normal in cut_planes:
+                        section = section.slice_plane(plane_origin, plane_normal, cap=True)
+                        if len(section.faces) == 0:
+                            break
+                    
+                    if self.verbose >= 2:
+                        print(f"Part {part_number}: Clipping completed, checking if empty...")
+                    
+                    # Check if the section contains geometry
+                    if len(section.faces) == 0:
+                        if self.verbose >= 2:
+                            print(f"Part {part_number}: No geometry in bounds - skipped")
+                        return None
+                    
+                    if self.verbose >= 2:
+                        print(f"Part {part_number}: Section has {len(section.faces)} faces, {len(section.vertices)} vertices")
+                    
+                    # Export the part
+                    output_filename = f"part_{part_number:02d}.stl"
+                    output_filepath = os.path.join(output_dir, output_filename)
+                    
+                    # Use trimesh export
+                    section.export(output_filepath)
+                    
+                    if self.verbose >= 2:
+                        print(f"Part {part_number}: SUCCESS (clipping) - {len(section.faces)} triangles, {len(section.vertices)} vertices → {output_filename}")
+                    
+                except Exception as clip_error:
+                    # Fallback to vertex filtering method if clipping fails
+                    print(f"Part {part_number}: Clipping failed ({clip_error}), trying fallback method...")
+                    print(f"Part {part_number}: Error type: {type(clip_error).__name__}")
+                    
+                    return self._write_fallback_part(tile_bounds, part_number, output_dir, candidates, "fallback")
             
-            # Write each triangle
-            for face in faces:
-                v1, v2, v3 = vertices[face]
+            else:
+                # Force fallback method (plane clipping not available)
+                if self.verbose >= 2:
+                    print(f"Part {part_number}: Using fallback method (plane clipping not available)...")
                 
-                # Calculate normal vector
-                edge1 = v2 - v1
-                edge2 = v3 - v1
-                normal = np.cross(edge1, edge2)
-                norm = np.linalg.norm(normal)
-                if norm > 0:
-                    normal = normal / norm
-                else:
-                    normal = np.array([0.0, 0.0, 1.0])
-                
-                # Write normal
-                f.write(struct.pack('<fff', *normal))
-                
-                # Write vertices
-                f.write(struct.pack('<fff', *v1))
-                f.write(struct.pack('<fff', *v2))
-                f.write(struct.pack('<fff', *v3))
-                
-                # Write attribute bytes
-                f.write(struct.pack('<H', 0))
+                return self._write_fallback_part(tile_bounds, part_number, output_dir, candidates, "forced fallback")
+            
+        except Exception as part_error:
+            print(f"Error processing part {part_number}: {part_error}")
+            import traceback
+            print(f"Part {part_number}: Traceback: {traceback.format_exc()}")
+            return None
+        
+        return output_filepath
+    
+    def _write_fallback_part(self, tile_bounds, part_number, output_dir, candidates, method):
+        """Export the faces with a vertex inside the tile, returning the file path or None if there are none"""
+        if self.verbose >= 2:
+            print(f"Part {part_number}: Original mesh has {len(self.faces)} faces, {len(self.vertices)} vertices")
+        
+        # Find faces that have at least one vertex in the bounds
+        part_vertices, reindexed_faces = self._extract_part(*tile_bounds, candidates)
+        
+        if self.verbose >= 2:
+            print(f"Part {part_number}: Found {len(reindexed_faces)} valid faces in bounds")
+        
+        if len(reindexed_faces) == 0:
+            if self.verbose >= 2:
+                print(f"Part {part_number}: No faces found in bounds - skipped")
+            return None
+        
+        if self.verbose >= 2:
+            print(f"Part {part_number}: Extracted {len(reindexed_faces)} faces, {len(part_vertices)} vertices")
+        
+        # Export the part using simple STL writer
+        output_filename = f"part_{part_number:02d}.stl"
+        output_filepath = os.path.join(output_dir, output_filename)
+        
+        self.write_stl_simple(output_filepath, part_vertices, reindexed_faces)
+        
+        if self.verbose >= 2:
+            print(f"Part {part_number}: SUCCESS ({method}) - {len(reindexed_faces)} triangles, {len(part_vertices)} vertices → {output_filename}")
+        
+        return output_filepath
+    
+    def _compute_face_bounds(self):
+        """Per-face bounding boxes, on the GPU via CuPy for large meshes"""
+        if CUPY_AVAILABLE and len(self.faces) >= GPU_MIN_FACES:
+            try:
+                triangles = cp.asarray(self.vertices)[cp.asarray(self.faces)]
+                self.face_min = triangles.min(axis=1).get()
+                self.face_max = triangles.max(axis=1).get()
+                return
+            except Exception as e:
+                # CuPy imports fine on machines without a usable CUDA device
+                print(f"GPU face bounds failed ({e}), using CPU")
+        
+        triangles = self.vertices[self.faces]
+        self.face_min = triangles.min(axis=1)
+        self.face_max = triangles.max(axis=1)
+    
+    def _bucket_faces(self, x_extent, y_extent):
+        """Face indices overlapping each tile of the split grid, as tile_faces[i][j]"""
+        # Range of tiles each face's bounding box touches (tile edges are inclusive)
+        xsplit = len(x_extent) - 1
+        ysplit = len(y_extent) - 1
+        cx0 = np.clip(np.searchsorted(x_extent[1:], self.face_min[:, 0], side='left'), 0, xsplit - 1)
+        cx1 = np.clip(np.searchsorted(x_extent[:-1], self.face_max[:, 0], side='right') - 1, 0, xsplit - 1)
+        cy0 = np.clip(np.searchsorted(y_extent[1:], self.face_min[:, 1], side='left'), 0, ysplit - 1)
+        cy1 = np.clip(np.searchsorted(y_extent[:-1], self.face_max[:, 1], side='right') - 1, 0, ysplit - 1)
+        
+        # Expand every face into one (face, tile) pair per tile it overlaps
+        count_y = cy1 - cy0 + 1
+        count = (cx1 - cx0 + 1) * count_y
+        face_ids = np.repeat(np.arange(len(count)), count)
+        offset = np.arange(len(face_ids)) - np.repeat(np.cumsum(count) - count, count)
+        tile_x = cx0[face_ids] + offset // count_y[face_ids]
+        tile_y = cy0[face_ids] + offset % count_y[face_ids]
+        
+        # Group the pairs by tile with one stable sort
+        tile_ids = tile_x * ysplit + tile_y
+        order = np.argsort(tile_ids, kind='stable')
+        starts = np.searchsorted(tile_ids[order], np.arange(xsplit * ysplit + 1))
+        face_ids = face_ids[order]
+        
+        return [[face_ids[starts[i * ysplit + j]:starts[i * ysplit + j + 1]] for j in range(ysplit)]
+                for i in range(xsplit)]
+    
+    def _extract_part(self, x_min, x_max, y_min, y_max, z_min, z_max, candidates=None):
+        """Collect faces with at least one vertex in bounds, reindexed onto their own vertices"""
+        original_vertices = self.vertices
+        original_faces = self.faces
+        part_min = np.array([x_min, y_min, z_min])
+        part_max = np.array([x_max, y_max, z_max])
+        
+        # Only faces whose bounding box overlaps the part can have a vertex inside it
+        if candidates is None:
+            candidates = np.nonzero(((self.face_min <= part_max) & (self.face_max >= part_min)).all(axis=1))[0]
+        
+        # Exact test on the candidates - keep faces with at least one corner inside
+        inside = faces_in_box(original_vertices, original_faces, candidates,
+                              x_min, x_max, y_min, y_max, z_min, z_max)
+        valid_faces = candidates[inside]
+        
+        # Extract valid faces and their vertices
+        part_faces = original_faces[valid_faces]
+        
+        # Get all unique vertices used by these faces, plus the reindexed faces
+        unique_vertex_indices, inverse = np.unique(part_faces, return_inverse=True)
+        part_vertices = original_vertices[unique_vertex_indices]
+        reindexed_faces = inverse.reshape(part_faces.shape).astype(np.uint32)
+        
+        return part_vertices, reindexed_faces
+    
+    def write_stl_simple(self, filename, vertices, faces):
+        """Simple STL writer as fallback"""
+        triangles = vertices[faces]
+        
+        # Calculate normal vectors for all triangles at once
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        norms = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.where(norms > 0, normals / np.where(norms > 0, norms, 1), [0.0, 0.0, 1.0])
+        
+        # Pre-size the file and fill the triangle records in place through a memmap
+        nbytes = 84 + len(faces) * STL_TRIANGLE_DTYPE.itemsize
+        with open(filename, 'wb') as f:
+            f.truncate(nbytes)
+        
+        mm = np.memmap(filename, mode='r+', dtype=np.uint8, shape=(nbytes,))
+        header = f'STL Part - {len(faces)} triangles'.encode('ascii')[:80]
+        mm[:80] = np.frombuffer(header.ljust(80, b'\0'), dtype=np.uint8)
+        mm[80:84].view('<u4')[0] = len(faces)
+        
+        # Attribute bytes stay zero from the truncate
+        records = mm[84:].view(STL_TRIANGLE_DTYPE)
+        records['normal'] = normals
+        records['vertices'] = triangles
+        mm.flush()
+        del records, mm
 
 def get_model_info(stl_file, flip_model=False):
     """Get model information without splitting"""
@@ -363,8 +531,8 @@ def get_model_info(stl_file, flip_model=False):
         info = {
             'triangles': len(processor.mesh.faces),
             'vertices': len(processor.mesh.vertices),
-            'watertight': processor.mesh.is_watertight,
-            'volume': processor.mesh.volume,
+            'watertight': processor.watertight,
+            'volume': processor.volume,
             'dimensions': f"{width:.1f}×{depth:.1f}×{height:.1f}",
             'width': width,
             'depth': depth,
@@ -382,6 +550,7 @@ def main():
         print("Usage:")
         print("  Info: python stl_processor.py info <stl_file> [flip_model]")
         print("  Split: python stl_processor.py split <stl_file> <max_x> <max_y> <max_z> <flip_model> <output_dir>")
+        print("  Set STL_VERBOSE=2 to print per-tile split progress (default 1 prints the load and split summary)")
         sys.exit(1)
     
     command = sys.argv[1]
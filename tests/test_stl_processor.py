@@ -0,0 +1,96 @@
+"""
+Regression tests for stl_processor.py
+Run with: python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import trimesh
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import stl_processor
+
+
+def load_quietly(processor, filepath, flip_model=False):
+    """Load an STL without the processor's progress output"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return processor.load_stl(filepath, flip_model)
+
+
+class FlippedFallbackTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+    
+    def _box_file(self, extents, offset, name='box.stl'):
+        box = trimesh.creation.box(extents=extents)
+        box.apply_translation(offset)
+        path = os.path.join(self.tmpdir.name, name)
+        box.export(path)
+        return path
+    
+    def test_fallback_keeps_every_face_of_flipped_box(self):
+        """Faces lying on the outer planes survive the float32 vertex test after a flip"""
+        rng = np.random.default_rng(1)
+        for k in range(50):
+            path = self._box_file(rng.uniform(1, 50, 3), rng.uniform(-50, 50, 3), f'box_{k}.stl')
+            processor = stl_processor.STLProcessor()
+            self.assertTrue(load_quietly(processor, path, flip_model=True))
+            
+            _, faces = processor._extract_part(*processor.model_bounds,
+                                               candidates=np.arange(len(processor.faces)))
+            self.assertEqual(len(faces), 12)
+    
+    def test_forced_fallback_split_covers_flipped_box(self):
+        """Every face of a flipped box lands in at least one forced-fallback part"""
+        rng = np.random.default_rng(2)
+        for k in range(10):
+            extents = rng.uniform(10, 50, 3)
+            path = self._box_file(extents, rng.uniform(-50, 50, 3), f'box_{k}.stl')
+            processor = stl_processor.STLProcessor()
+            self.assertTrue(load_quietly(processor, path, flip_model=True))
+            processor.force_fallback = True
+            
+            # Roughly a 2x2 grid of tiles
+            output_dir = os.path.join(self.tmpdir.name, f'parts_{k}')
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertTrue(processor.split_model(extents[0] * 0.6, extents[1] * 0.6, 250.0, output_dir))
+            
+            # Match the written triangles back to the loaded ones by their float32 corners
+            expected = {tri.tobytes() for tri in processor.vertices[processor.faces]}
+            written = set()
+            for name in os.listdir(output_dir):
+                records = np.fromfile(os.path.join(output_dir, name), dtype=np.uint8)[84:]
+                written.update(tri.tobytes() for tri in records.view(stl_processor.STL_TRIANGLE_DTYPE)['vertices'])
+            
+            self.assertEqual(expected - written, set())
+
+
+class MeshCacheTest(unittest.TestCase):
+    def test_ascii_stl_cache_round_trip_is_exact(self):
+        """A cached load of an ASCII STL reproduces the uncached mesh bit for bit"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            box = trimesh.creation.box(extents=[10.1, 3.3, 7.7])
+            box.apply_translation([0.1, 0.2, 0.3])
+            path = os.path.join(tmpdir, 'box.stl')
+            with open(path, 'w') as f:
+                f.write(trimesh.exchange.stl.export_stl_ascii(box))
+            
+            first = stl_processor.STLProcessor()
+            self.assertTrue(load_quietly(first, path))
+            self.assertTrue(os.path.exists(path + '.cache.npz'))
+            cached = stl_processor.STLProcessor()
+            self.assertTrue(load_quietly(cached, path))
+            
+            np.testing.assert_array_equal(cached.mesh.vertices, first.mesh.vertices)
+            np.testing.assert_array_equal(cached.model_bounds, first.model_bounds)
+
+
+if __name__ == '__main__':
+    unittest.main()